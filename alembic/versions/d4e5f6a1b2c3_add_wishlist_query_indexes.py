@@ -0,0 +1,47 @@
+"""add_wishlist_query_indexes
+
+Revision ID: d4e5f6a1b2c3
+Revises: c3d4e5f6a1b2
+Create Date: 2026-08-31 12:00:00.000000
+
+Compound indexes for the wishlist queries: per-user request filters, the
+ORDER BY downloaded on manual requests, and the GROUP BY downloaded in the
+wishlist counts.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a1b2c3"
+down_revision: Union[str, None] = "c3d4e5f6a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audiobookrequest_user_username_audiobook_id",
+        "audiobookrequest",
+        ["user_username", "audiobook_id"],
+    )
+    op.create_index(
+        "ix_manualbookrequest_user_username_downloaded",
+        "manualbookrequest",
+        ["user_username", "downloaded"],
+    )
+    op.create_index("ix_audiobook_downloaded", "audiobook", ["downloaded"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audiobook_downloaded", table_name="audiobook")
+    op.drop_index(
+        "ix_manualbookrequest_user_username_downloaded",
+        table_name="manualbookrequest",
+    )
+    op.drop_index(
+        "ix_audiobookrequest_user_username_audiobook_id",
+        table_name="audiobookrequest",
+    )
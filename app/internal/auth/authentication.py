@@ -208,6 +208,41 @@ class ABRAuth(SecurityBase):
         self,
         request: Request,
         session: Annotated[Session, Depends(get_session)],
+    ) -> DetailedUser:
+        # several ABRAuth instances can resolve within the same request; the
+        # credential check (and any failure) is memoized on request.state so
+        # only the first resolution pays for it and a cached failure is
+        # replayed without re-running the solver chain below it
+        user: DetailedUser | None = getattr(request.state, "_abr_user", None)
+        if user is None:
+            failure: Exception | None = getattr(
+                request.state, "_abr_auth_failure", None
+            )
+            if failure is not None:
+                raise failure
+            try:
+                user = await self._resolve_user(request, session)
+            except (HTTPException, RequiresLoginException) as e:
+                request.state._abr_auth_failure = e
+                raise
+            request.state._abr_user = user
+
+        if not user.is_above(self.lowest_allowed_group):
+            logger.warning(
+                "User does not have sufficient permissions",
+                username=user.username,
+                group=user.group,
+                lowest_allowed_group=self.lowest_allowed_group,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden"
+            )
+        return user
+
+    async def _resolve_user(
+        self,
+        request: Request,
+        session: Session,
     ) -> DetailedUser:
         login_type = auth_config.get_login_type(session)
 
@@ -226,17 +261,6 @@ class ABRAuth(SecurityBase):
         else:
             standard_user = await self._get_basic_auth(request, session)
 
-        if not standard_user.is_above(self.lowest_allowed_group):
-            logger.warning(
-                "User does not have sufficient permissions",
-                username=standard_user.username,
-                group=standard_user.group,
-                lowest_allowed_group=self.lowest_allowed_group,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden"
-            )
-
         try:
             user = DetailedUser.model_validate(
                 standard_user, update={"login_type": login_type}
@@ -1,9 +1,9 @@
-from typing import Literal, Sequence, cast
+from dataclasses import dataclass
+from typing import Literal, Sequence
 
-from pydantic import BaseModel
-from sqlalchemy import func
-from sqlalchemy.orm import InstrumentedAttribute, selectinload
-from sqlmodel import Session, asc, col, not_, select
+from sqlalchemy import ColumnElement, func
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import Session, asc, col, exists, literal, not_, select
 
 from app.internal.models import (
     Audiobook,
@@ -14,7 +14,10 @@ from app.internal.models import (
 )
 
 
-class WishlistCounts(BaseModel):
+# plain server-side DTO fed by trusted SQL aggregates; a slotted dataclass
+# skips the Pydantic validator dispatch on every page render
+@dataclass(slots=True)
+class WishlistCounts:
     requests: int
     downloaded: int
     manual: int
@@ -27,30 +30,35 @@ def get_wishlist_counts(session: Session, user: User | None = None) -> WishlistC
     """
     username = None if user is None or user.is_admin() else user.username
 
-    rows = session.exec(
-        select(Audiobook.downloaded, func.count("*"))
-        .where(not username or AudiobookRequest.user_username == username)
+    # both aggregates ride in one UNION ALL so the page render only pays a
+    # single database round trip
+    book_counts = (
+        select(literal("book"), Audiobook.downloaded, func.count("*"))
         .select_from(Audiobook)
         .join(AudiobookRequest)
         .group_by(col(Audiobook.downloaded))
-    ).all()
+    )
+    manual_count = (
+        select(literal("manual"), literal(False), func.count())
+        .select_from(ManualBookRequest)
+        .where(col(ManualBookRequest.user_username).is_not(None))
+    )
+    if username is not None:
+        book_counts = book_counts.where(AudiobookRequest.user_username == username)
+        manual_count = manual_count.where(ManualBookRequest.user_username == username)
+    rows = session.exec(book_counts.union_all(manual_count)).all()
+
     requests = 0
     downloaded = 0
-    for downloaded_status, count in rows:
-        if downloaded_status:
+    manual = 0
+    for kind, downloaded_status, count in rows:
+        if kind == "manual":
+            manual = count
+        elif downloaded_status:
             downloaded = count
         else:
             requests = count
 
-    manual = session.exec(
-        select(func.count())
-        .select_from(ManualBookRequest)
-        .where(
-            not username or ManualBookRequest.user_username == username,
-            col(ManualBookRequest.user_username).is_not(None),
-        )
-    ).one()
-
     return WishlistCounts(
         requests=requests,
         downloaded=downloaded,
@@ -67,31 +75,35 @@ def get_wishlist_results(
     Gets the books that have been requested. If a username is given only the books requested by that
     user are returned. If no username is given, all book requests are returned.
     """
+    conditions: list[ColumnElement[bool]] = []
     match response_type:
         case "downloaded":
-            clause = Audiobook.downloaded
+            conditions.append(col(Audiobook.downloaded))
         case "not_downloaded":
-            clause = not_(Audiobook.downloaded)
+            conditions.append(not_(col(Audiobook.downloaded)))
         case _:
-            clause = True
+            pass
+
+    # correlated EXISTS lets the planner run a semi-join and stop at the
+    # first matching request instead of materializing the IN list; the
+    # username condition is only added when one applies, so admins and
+    # regular users each hit a stable, parametrized statement
+    has_request = exists(select(1).select_from(AudiobookRequest)).where(
+        AudiobookRequest.audiobook_id == Audiobook.id
+    )
+    if username is not None:
+        has_request = has_request.where(AudiobookRequest.user_username == username)
+    conditions.append(has_request)
 
     results = session.exec(
         select(Audiobook)
-        .where(
-            clause,
-            col(Audiobook.id).in_(
-                select(AudiobookRequest.audiobook_id).where(
-                    not username or AudiobookRequest.user_username == username
-                )
-            ),
-        )
+        .where(*conditions)
         .options(
-            selectinload(
-                cast(
-                    InstrumentedAttribute[list[AudiobookRequest]],
-                    cast(object, Audiobook.requests),
-                )
-            )
+            # selectin keeps it at exactly two queries regardless of result
+            # size; raiseload turns any lazy emit that sneaks back in into a
+            # loud error instead of a silent N+1
+            selectinload(Audiobook.requests),  # pyright: ignore[reportArgumentType]
+            raiseload("*"),
         )
     ).all()
 
@@ -107,11 +119,11 @@ def get_wishlist_results(
 def get_all_manual_requests(
     session: Session, user: User
 ) -> Sequence[ManualBookRequest]:
-    return session.exec(
+    statement = (
         select(ManualBookRequest)
-        .where(
-            user.is_admin() or ManualBookRequest.user_username == user.username,
-            col(ManualBookRequest.user_username).is_not(None),
-        )
+        .where(col(ManualBookRequest.user_username).is_not(None))
         .order_by(asc(ManualBookRequest.downloaded))
-    ).all()
+    )
+    if not user.is_admin():
+        statement = statement.where(ManualBookRequest.user_username == user.username)
+    return session.exec(statement).all()
@@ -28,6 +28,41 @@ class IndexerContext(BaseModel, arbitrary_types_allowed=True):
     enabled: bool
 
 
+indexer_registry: dict[str, type[AbstractIndexer[Configurations]]] = {
+    Indexer.name: Indexer for Indexer in indexers
+}
+
+
+async def _build_indexer_context(
+    Indexer: type[AbstractIndexer[Configurations]],
+    container: SessionContainer,
+    *,
+    check_required: bool,
+) -> IndexerContext:
+    configuration = await Indexer.get_configurations(container)
+    filtered_configuration: dict[str, IndexerConfiguration[Any]] = dict()
+    for k, v in vars(configuration).items():  # pyright: ignore[reportAny]
+        if isinstance(v, IndexerConfiguration):
+            filtered_configuration[k] = v
+
+    valued_configuration = create_valued_configuration(
+        configuration,
+        container.session,
+        check_required=check_required,
+    )
+
+    indexer = Indexer()
+
+    indexer_enabled = await indexer.is_enabled(container, valued_configuration)
+
+    return IndexerContext(
+        indexer=indexer,
+        configuration=filtered_configuration,
+        valued=valued_configuration,
+        enabled=indexer_enabled,
+    )
+
+
 async def get_indexer_contexts(
     container: SessionContainer,
     *,
@@ -39,34 +74,15 @@ async def get_indexer_contexts(
     contexts: list[IndexerContext] = []
     for Indexer in indexers:
         try:
-            configuration = await Indexer.get_configurations(container)
-            filtered_configuration: dict[str, IndexerConfiguration[Any]] = dict()
-            for k, v in vars(configuration).items():  # pyright: ignore[reportAny]
-                if isinstance(v, IndexerConfiguration):
-                    filtered_configuration[k] = v
-
-            valued_configuration = create_valued_configuration(
-                configuration,
-                container.session,
-                check_required=check_required,
+            context = await _build_indexer_context(
+                Indexer, container, check_required=check_required
             )
 
-            indexer = Indexer()
-
-            indexer_enabled = await indexer.is_enabled(container, valued_configuration)
-
-            if not return_disabled and not indexer_enabled:
+            if not return_disabled and not context.enabled:
                 logger.debug("Indexer is disabled", name=Indexer.name)
                 continue
 
-            contexts.append(
-                IndexerContext(
-                    indexer=indexer,
-                    configuration=filtered_configuration,
-                    valued=valued_configuration,
-                    enabled=indexer_enabled,
-                )
-            )
+            contexts.append(context)
         except ConfigurationException as e:
             logger.error(
                 "Failed to get configurations for Indexer",
@@ -77,33 +93,51 @@ async def get_indexer_contexts(
     return contexts
 
 
+async def get_indexer_context(
+    name: str,
+    container: SessionContainer,
+    *,
+    check_required: bool = False,
+) -> IndexerContext:
+    """Builds the configuration context for a single indexer without instantiating the others."""
+
+    Indexer = indexer_registry.get(name)
+    if Indexer is None:
+        raise ValueError("Indexer not found")
+    try:
+        return await _build_indexer_context(
+            Indexer, container, check_required=check_required
+        )
+    except ConfigurationException as e:
+        raise ValueError(str(e))
+
+
 async def update_single_indexer(
     indexer_select: str,
     values: Mapping[str, object],
     session: Session,
     client_session: ClientSession,
     ignore_missing_booleans: bool = False,
+    defer_flush: bool = False,
+    container: SessionContainer | None = None,
 ):
     """
     Update a single indexer with the given values.
 
     `ignore_missing_booleans` can be set to true to ignore missing boolean values. By default, missing booleans are treated as false.
-    """
 
-    session_container = SessionContainer(session=session, client_session=client_session)
-    contexts = await get_indexer_contexts(
-        session_container, check_required=False, return_disabled=True
-    )
+    `defer_flush` skips the per-call commit and prowlarr cache flush so that callers
+    updating many indexers can commit and flush once at the end.
 
-    updated_context: IndexerContext | None = None
-    for context in contexts:
-        if context.indexer.name == indexer_select:
-            updated_context = context
-            break
+    `container` allows reusing an already constructed session container.
+    """
 
-    if not updated_context:
-        raise ValueError("Indexer not found")
+    session_container = container or SessionContainer(
+        session=session, client_session=client_session
+    )
+    updated_context = await get_indexer_context(indexer_select, session_container)
 
+    pending: dict[str, str] = {}
     for key, context in updated_context.configuration.items():
         value = values.get(key)
         if value is None:
@@ -114,9 +148,10 @@ async def update_single_indexer(
                 logger.warning("Value is missing for key", key=key)
                 continue
         if context.type_ is bool:
-            indexer_configuration_cache.set_bool(session, key, value == "on")
+            pending[key] = str(int(value == "on"))
         else:
-            indexer_configuration_cache.set(session, key, str(value))
+            pending[key] = str(value)
+    indexer_configuration_cache.set_many(session, pending, commit=not defer_flush)
 
     if "enabled" in values and (
         isinstance(e := values["enabled"], str)
@@ -130,4 +165,5 @@ async def update_single_indexer(
             enabled,
         )
 
-    flush_prowlarr_cache()
+    if not defer_flush:
+        flush_prowlarr_cache()
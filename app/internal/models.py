@@ -7,7 +7,7 @@ from enum import Enum
 from typing import Annotated, Literal, Union, cast
 
 from pydantic import BaseModel, ConfigDict
-from sqlmodel import JSON, Column, DateTime, Field, SQLModel, func
+from sqlmodel import JSON, Column, DateTime, Field, Index, SQLModel, func
 from sqlmodel.main import Relationship
 
 
@@ -98,7 +98,7 @@ class Audiobook(BaseSQLModel, table=True):
             nullable=False,
         ),
     )
-    downloaded: bool = False
+    downloaded: bool = Field(default=False, index=True)
 
     requests: list["AudiobookRequest"] = Relationship(back_populates="audiobook")  # pyright: ignore[reportAny]
 
@@ -114,6 +114,16 @@ class Audiobook(BaseSQLModel, table=True):
 
 
 class AudiobookRequest(BaseSQLModel, table=True):
+    # covers per-user wishlist filters; the composite primary key only helps
+    # lookups leading with audiobook_id
+    __table_args__ = (
+        Index(
+            "ix_audiobookrequest_user_username_audiobook_id",
+            "user_username",
+            "audiobook_id",
+        ),
+    )
+
     audiobook_id: uuid.UUID = Field(
         primary_key=True,
         foreign_key="audiobook.id",
@@ -168,6 +178,15 @@ class AudiobookWishlistResult(BaseModel):
 
 
 class ManualBookRequest(BaseSQLModel, table=True):
+    # matches the per-user filter + ORDER BY downloaded in get_all_manual_requests
+    __table_args__ = (
+        Index(
+            "ix_manualbookrequest_user_username_downloaded",
+            "user_username",
+            "downloaded",
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_username: str = Field(foreign_key="user.username", ondelete="CASCADE")
     title: str
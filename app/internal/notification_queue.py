@@ -0,0 +1,52 @@
+"""
+Single long-lived worker that drains notification jobs off the request path.
+
+FastAPI BackgroundTasks run on the worker's event loop right after the
+response and contend with the next request; handlers instead enqueue a job
+here in O(1) and the consumer task started at app lifespan fans it out.
+"""
+
+import asyncio
+from contextlib import suppress
+from typing import Any, Callable, Coroutine
+
+from app.util.log import logger
+
+NotificationJob = Callable[[], Coroutine[Any, Any, None]]
+
+_queue: asyncio.Queue[NotificationJob] = asyncio.Queue()
+_worker_task: asyncio.Task[None] | None = None
+
+
+def enqueue_notification(job: NotificationJob) -> None:
+    """Hand a notification coroutine factory to the worker without awaiting it."""
+    _queue.put_nowait(job)
+
+
+async def _drain() -> None:
+    while True:
+        job = await _queue.get()
+        try:
+            await job()
+        except Exception as e:
+            logger.error("Notification job failed", error=str(e))
+        finally:
+            _queue.task_done()
+
+
+def start_notification_worker() -> None:
+    global _worker_task
+    if _worker_task is None or _worker_task.done():
+        _worker_task = asyncio.create_task(_drain())
+
+
+async def stop_notification_worker() -> None:
+    """Let queued notifications finish, then cancel the worker."""
+    global _worker_task
+    if _worker_task is None:
+        return
+    await _queue.join()
+    _worker_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await _worker_task
+    _worker_task = None
@@ -1,4 +1,5 @@
 import json
+import uuid
 
 from aiohttp import ClientSession, InvalidUrlClientError
 from sqlmodel import Session, select
@@ -216,12 +217,21 @@ async def send_manual_notification(
 
 async def send_all_manual_notifications(
     event_type: EventEnum,
-    book_request: ManualBookRequest,
+    book_request_id: uuid.UUID,
     other_replacements: dict[str, str] | None = None,
 ):
     if other_replacements is None:
         other_replacements = {}
     with next(get_session()) as session:
+        # re-fetched here so the request handler only has to hand over the id
+        # instead of building a validated copy before responding
+        book_request = session.get(ManualBookRequest, book_request_id)
+        if book_request is None:
+            logger.warning(
+                "Manual book request no longer exists, skipping notifications",
+                book_request_id=str(book_request_id),
+            )
+            return
         user = session.exec(
             select(User).where(User.username == book_request.user_username)
         ).first()
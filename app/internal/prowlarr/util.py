@@ -1,4 +1,5 @@
 import json
+from dataclasses import dataclass
 from typing import Literal
 
 from sqlmodel import Session
@@ -21,6 +22,16 @@ ProwlarrConfigKey = Literal[
 ]
 
 
+@dataclass(frozen=True)
+class ProwlarrSelection:
+    """Immutable snapshot of the prowlarr connection and selection config."""
+
+    base_url: str | None
+    api_key: str | None
+    categories: frozenset[int]
+    indexers: frozenset[int]
+
+
 class ProwlarrConfig(StringConfigCache[ProwlarrConfigKey]):
     def raise_if_invalid(self, session: Session):
         if not self.get_base_url(session):
@@ -73,6 +84,28 @@ class ProwlarrConfig(StringConfigCache[ProwlarrConfigKey]):
     def set_indexers(self, session: Session, indexers: list[int]):
         self.set(session, "prowlarr_indexers", json.dumps(indexers))
 
+    def get_selection(self, session: Session) -> ProwlarrSelection:
+        """Loads all connection and selection keys in one batched query."""
+        values = self.get_many(
+            session,
+            "prowlarr_base_url",
+            "prowlarr_api_key",
+            "prowlarr_categories",
+            "prowlarr_indexers",
+        )
+        categories = values.get("prowlarr_categories")
+        indexers = values.get("prowlarr_indexers")
+        return ProwlarrSelection(
+            base_url=(values.get("prowlarr_base_url") or "").rstrip("/") or None,
+            api_key=values.get("prowlarr_api_key"),
+            categories=frozenset(json.loads(categories))
+            if categories is not None
+            else frozenset({3030}),
+            indexers=frozenset(json.loads(indexers))
+            if indexers is not None
+            else frozenset(),
+        )
+
 
 prowlarr_config = ProwlarrConfig()
 prowlarr_source_cache = SimpleCache[list[ProwlarrSource], str]()
@@ -1,4 +1,5 @@
 # To dermine what is currently being queried:
+import asyncio
 from contextlib import contextmanager
 from typing import Literal
 
@@ -40,6 +41,9 @@ class QueryResult(pydantic.BaseModel):
         return self.state == "ok"
 
 
+_inflight_queries: dict[str, asyncio.Task[QueryResult]] = {}
+
+
 async def query_sources(
     asin: str,
     session: Session,
@@ -48,6 +52,56 @@ async def query_sources(
     force_refresh: bool = False,
     start_auto_download: bool = False,
     only_return_if_cached: bool = False,
+) -> QueryResult:
+    """Single-flight wrapper around the Prowlarr lookup.
+
+    Concurrent callers asking for the same ASIN share one upstream fan-out to
+    the indexers instead of each paying for their own. Refreshes, downloads
+    and cache-only probes keep their own call since they have side effects or
+    must not wait on a full query.
+    """
+    if force_refresh or start_auto_download or only_return_if_cached:
+        return await _query_sources(
+            asin,
+            session,
+            client_session,
+            requester,
+            force_refresh=force_refresh,
+            start_auto_download=start_auto_download,
+            only_return_if_cached=only_return_if_cached,
+        )
+
+    task = _inflight_queries.get(asin)
+    if task is None:
+        task = asyncio.create_task(
+            _query_sources_detached(asin, client_session, requester)
+        )
+        _inflight_queries[asin] = task
+        task.add_done_callback(lambda _: _inflight_queries.pop(asin, None))
+    # shield so one caller disconnecting does not cancel the shared query
+    return await asyncio.shield(task)
+
+
+async def _query_sources_detached(
+    asin: str,
+    client_session: ClientSession,
+    requester: User,
+) -> QueryResult:
+    # the shared task can outlive the request that started it, and FastAPI
+    # tears that request's session down on disconnect; run on a dedicated
+    # session instead of borrowing the first caller's
+    with next(get_session()) as session:
+        return await _query_sources(asin, session, client_session, requester)
+
+
+async def _query_sources(
+    asin: str,
+    session: Session,
+    client_session: ClientSession,
+    requester: User,
+    force_refresh: bool = False,
+    start_auto_download: bool = False,
+    only_return_if_cached: bool = False,
 ) -> QueryResult:
     book = session.exec(select(Audiobook).where(Audiobook.asin == asin)).first()
     if not book:
@@ -0,0 +1,31 @@
+from sqlmodel import Session
+
+from app.internal.db_queries import WishlistCounts, get_wishlist_counts
+from app.internal.models import User
+from app.util.cache import SimpleCache
+
+# counts only feed the wishlist tab badges, a little staleness is fine
+wishlist_counts_ttl = 30
+
+_counts_cache = SimpleCache[WishlistCounts, str]()
+
+
+def get_cached_wishlist_counts(
+    session: Session, user: User | None = None
+) -> WishlistCounts:
+    """Serves the wishlist tab counts from a short-lived cache.
+
+    Admins all share one entry since they see the counts across every user.
+    """
+    key = "__all__" if user is None or user.is_admin() else user.username
+    counts = _counts_cache.get(wishlist_counts_ttl, key)
+    if counts is None:
+        counts = get_wishlist_counts(session, user)
+        _counts_cache.set(counts, key)
+    return counts
+
+
+def flush_wishlist_counts():
+    """Drops all cached counts. A request by one user also changes the counts
+    admins see, so flushing everything is the only safe invalidation."""
+    _counts_cache.flush()
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from typing import Awaitable, Callable
 from urllib.parse import quote_plus, urlencode
 
@@ -18,7 +19,12 @@ from app.internal.auth.session_middleware import (
 from app.internal.book_search import clear_old_book_caches
 from app.internal.env_settings import Settings
 from app.internal.models import User
+from app.internal.notification_queue import (
+    start_notification_worker,
+    stop_notification_worker,
+)
 from app.routers import api, auth, root, search, settings, wishlist
+from app.util.connection import close_connection
 from app.util.db import get_session
 from app.util.fetch_js import fetch_scripts
 from app.util.redirect import BaseUrlRedirectResponse
@@ -34,7 +40,18 @@ with next(get_session()) as session:
     clear_old_book_caches(session)
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    start_notification_worker()
+    yield
+    # flush pending notifications, then drop the pooled aiohttp session and
+    # its keep-alive connections
+    await stop_notification_worker()
+    await close_connection()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="AudioBookRequest",
     debug=Settings().app.debug,
     openapi_url="/openapi.json" if Settings().app.openapi_enabled else None,
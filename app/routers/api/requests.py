@@ -1,4 +1,6 @@
+import asyncio
 import uuid
+from functools import partial
 from typing import Annotated, Literal
 
 from aiohttp import ClientSession
@@ -11,6 +13,7 @@ from fastapi import (
     Response,
 )
 from pydantic import BaseModel
+from sqlalchemy import bindparam
 from sqlmodel import Session, asc, col, select, delete
 
 from app.internal.auth.authentication import APIKeyAuth, DetailedUser
@@ -29,6 +32,7 @@ from app.internal.models import (
     ManualBookRequest,
     User,
 )
+from app.internal.notification_queue import enqueue_notification
 from app.internal.notifications import (
     send_all_manual_notifications,
     send_all_notifications,
@@ -38,6 +42,7 @@ from app.internal.prowlarr.util import ProwlarrMisconfigured, prowlarr_config
 from app.internal.query import query_sources, QueryResult, background_start_query
 from app.internal.ranking.quality import quality_config
 from app.internal.db_queries import get_wishlist_results
+from app.internal.wishlist_cache import flush_wishlist_counts
 from app.util.connection import get_connection
 from app.util.db import get_session
 from app.util.log import logger
@@ -51,6 +56,28 @@ class DownloadSourceBody(BaseModel):
     indexer_id: int
 
 
+# built once; the asin lookup rides the unique index, and reusing the same
+# statement object keeps the compiled-SQL cache hot across requests
+_BOOK_BY_ASIN = (
+    select(Audiobook).where(col(Audiobook.asin) == bindparam("asin")).limit(1)
+)
+
+# concurrent requests for the same book share a single in-flight Audible lookup
+_inflight_book_lookups: dict[tuple[str, str], asyncio.Task[Audiobook | None]] = {}
+
+
+async def _get_book_by_asin_coalesced(
+    client_session: ClientSession, asin: str, region: audible_region_type
+) -> Audiobook | None:
+    key = (asin, region)
+    task = _inflight_book_lookups.get(key)
+    if task is None:
+        task = asyncio.create_task(get_book_by_asin(client_session, asin, region))
+        _inflight_book_lookups[key] = task
+        task.add_done_callback(lambda _: _inflight_book_lookups.pop(key, None))
+    return await asyncio.shield(task)
+
+
 @router.post("/{asin}", status_code=201)
 async def create_request(
     session: Annotated[Session, Depends(get_session)],
@@ -65,7 +92,7 @@ async def create_request(
     if audible_regions.get(region) is None:
         raise HTTPException(status_code=400, detail="Invalid region")
 
-    book = await get_book_by_asin(client_session, asin, region)
+    book = await _get_book_by_asin_coalesced(client_session, asin, region)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
 
@@ -78,6 +105,9 @@ async def create_request(
         book_request = AudiobookRequest(asin=asin, user_username=user.username)
         session.add(book_request)
         session.commit()
+        # invalidated here so both the REST endpoint and the UI wrappers that
+        # delegate to it refresh the wishlist tab counts
+        flush_wishlist_counts()
         logger.info(
             "Added new audiobook request",
             username=user.username,
@@ -86,11 +116,13 @@ async def create_request(
     else:
         raise HTTPException(status_code=409, detail="Book already requested")
 
-    background_task.add_task(
-        send_all_notifications,
-        event_type=EventEnum.on_new_request,
-        requester=User.model_validate(user),
-        book_asin=asin,
+    enqueue_notification(
+        partial(
+            send_all_notifications,
+            event_type=EventEnum.on_new_request,
+            requester=User.model_validate(user),
+            book_asin=asin,
+        )
     )
 
     if quality_config.get_auto_download(session) and user.is_above(GroupEnum.trusted):
@@ -134,6 +166,7 @@ async def delete_request(
             )
         )
     session.commit()
+    flush_wishlist_counts()
     return Response(status_code=204)
 
 
@@ -141,20 +174,22 @@ async def delete_request(
 async def mark_downloaded(
     asin: str,
     session: Annotated[Session, Depends(get_session)],
-    background_task: BackgroundTasks,
     _: Annotated[DetailedUser, Security(APIKeyAuth(GroupEnum.admin))],
 ):
-    book = session.exec(select(Audiobook).where(Audiobook.asin == asin)).first()
+    book = session.exec(_BOOK_BY_ASIN, params={"asin": asin}).first()
     if book:
         book.downloaded = True
         session.add(book)
         session.commit()
-
-        background_task.add_task(
-            send_all_notifications,
-            event_type=EventEnum.on_successful_download,
-            requester=None,
-            book_asin=asin,
+        flush_wishlist_counts()
+
+        enqueue_notification(
+            partial(
+                send_all_notifications,
+                event_type=EventEnum.on_successful_download,
+                requester=None,
+                book_asin=asin,
+            )
         )
         return Response(status_code=204)
     raise HTTPException(status_code=404, detail="Book not found")
@@ -188,7 +223,6 @@ class ManualRequest(BaseModel):
 async def create_manual_request(
     body: ManualRequest,
     session: Annotated[Session, Depends(get_session)],
-    background_task: BackgroundTasks,
     user: Annotated[DetailedUser, Security(APIKeyAuth())],
 ):
     book_request = ManualBookRequest(
@@ -202,11 +236,14 @@ async def create_manual_request(
     )
     session.add(book_request)
     session.commit()
+    flush_wishlist_counts()
 
-    background_task.add_task(
-        send_all_manual_notifications,
-        event_type=EventEnum.on_new_request,
-        book_request=ManualBookRequest.model_validate(book_request),
+    enqueue_notification(
+        partial(
+            send_all_manual_notifications,
+            event_type=EventEnum.on_new_request,
+            book_request_id=book_request.id,
+        )
     )
     return Response(status_code=201)
 
@@ -241,7 +278,6 @@ async def update_manual_request(
 async def mark_manual_downloaded(
     id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    background_task: BackgroundTasks,
     _: Annotated[DetailedUser, Security(APIKeyAuth(GroupEnum.admin))],
 ):
     book_request = session.get(ManualBookRequest, id)
@@ -249,11 +285,14 @@ async def mark_manual_downloaded(
         book_request.downloaded = True
         session.add(book_request)
         session.commit()
+        flush_wishlist_counts()
 
-        background_task.add_task(
-            send_all_manual_notifications,
-            event_type=EventEnum.on_successful_download,
-            book_request=ManualBookRequest.model_validate(book_request),
+        enqueue_notification(
+            partial(
+                send_all_manual_notifications,
+                event_type=EventEnum.on_successful_download,
+                book_request_id=book_request.id,
+            )
         )
         return Response(status_code=204)
     raise HTTPException(status_code=404, detail="Request not found")
@@ -269,6 +308,7 @@ async def delete_manual_request(
     if book:
         session.delete(book)
         session.commit()
+        flush_wishlist_counts()
         return Response(status_code=204)
     raise HTTPException(status_code=404, detail="Request not found")
 
@@ -340,11 +380,12 @@ async def download_book(
     if not resp.ok:
         raise HTTPException(status_code=500, detail="Failed to start download")
 
-    book = session.exec(select(Audiobook).where(Audiobook.asin == asin)).first()
+    book = session.exec(_BOOK_BY_ASIN, params={"asin": asin}).first()
     if book:
         book.downloaded = True
         session.add(book)
         session.commit()
+    flush_wishlist_counts()
 
     return Response(status_code=204)
 
@@ -367,4 +408,6 @@ async def start_auto_download_endpoint(
     except HTTPException as e:
         raise ToastException(e.detail) from None
 
+    # the auto download may have marked the book downloaded
+    flush_wishlist_counts()
     return Response(status_code=204)
@@ -4,6 +4,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Response, Security
 from pydantic import BaseModel, Field
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.internal.auth.authentication import (
     APIKeyAuth,
@@ -14,7 +15,7 @@ from app.internal.auth.authentication import (
     raise_for_invalid_password,
 )
 from app.internal.models import APIKey, APIKeyResponse, User
-from app.util.db import get_session
+from app.util.db import get_async_session, get_session
 
 router = APIRouter(prefix="/account", tags=["Account"])
 
@@ -34,28 +35,34 @@ class ChangePasswordRequest(BaseModel):
     confirm_password: str
 
 
+class ToggleAPIKeyResponse(BaseModel):
+    enabled: bool
+
+
 @router.get("/api-keys", response_model=list[APIKeyResponse])
-def list_api_keys(
-    session: Annotated[Session, Depends(get_session)],
+async def list_api_keys(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(APIKeyAuth())],
 ):
-    api_keys = session.exec(
-        select(APIKey).where(APIKey.user_username == user.username)
+    api_keys = (
+        await session.exec(select(APIKey).where(APIKey.user_username == user.username))
     ).all()
     return api_keys
 
 
 @router.post("/api-keys", response_model=CreateAPIKeyResponse)
-def create_new_api_key(
+async def create_new_api_key(
     body: CreateAPIKeyRequest,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(APIKeyAuth())],
 ):
     name = body.name.strip()
-    same_name_key = session.exec(
-        select(APIKey).where(
-            APIKey.user_username == user.username,
-            APIKey.name == name,
+    same_name_key = (
+        await session.exec(
+            select(APIKey).where(
+                APIKey.user_username == user.username,
+                APIKey.name == name,
+            )
         )
     ).first()
     if same_name_key:
@@ -63,15 +70,15 @@ def create_new_api_key(
 
     api_key, private_key = create_api_key(user, name)
     session.add(api_key)
-    session.commit()
+    await session.commit()
 
     return CreateAPIKeyResponse(name=name, key=private_key)
 
 
 @router.delete("/api-keys/{id}")
-def delete_api_key(
+async def delete_api_key(
     id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(APIKeyAuth())],
 ):
     try:
@@ -79,24 +86,26 @@ def delete_api_key(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid UUID")
 
-    api_key = session.exec(
-        select(APIKey).where(
-            APIKey.user_username == user.username,
-            APIKey.id == uuid_id,
+    api_key = (
+        await session.exec(
+            select(APIKey).where(
+                APIKey.user_username == user.username,
+                APIKey.id == uuid_id,
+            )
         )
     ).first()
     if not api_key:
         raise HTTPException(status_code=404, detail="API key not found")
 
-    session.delete(api_key)
-    session.commit()
+    await session.delete(api_key)
+    await session.commit()
     return Response(status_code=204)
 
 
-@router.patch("/api-keys/{id}/toggle")
-def toggle_api_key(
+@router.patch("/api-keys/{id}/toggle", response_model=ToggleAPIKeyResponse)
+async def toggle_api_key(
     id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(APIKeyAuth())],
 ):
     try:
@@ -104,19 +113,22 @@ def toggle_api_key(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid UUID")
 
-    api_key = session.exec(
-        select(APIKey).where(
-            APIKey.user_username == user.username,
-            APIKey.id == uuid_id,
+    api_key = (
+        await session.exec(
+            select(APIKey).where(
+                APIKey.user_username == user.username,
+                APIKey.id == uuid_id,
+            )
         )
     ).first()
     if not api_key:
         raise HTTPException(status_code=404, detail="API key not found")
 
     api_key.enabled = not api_key.enabled
+    enabled = api_key.enabled
     session.add(api_key)
-    session.commit()
-    return Response(status_code=204)
+    await session.commit()
+    return ToggleAPIKeyResponse(enabled=enabled)
 
 
 @router.put("/password")
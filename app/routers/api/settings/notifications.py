@@ -2,6 +2,11 @@ import json
 import uuid
 from typing import Annotated, cast
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an install-time dependency
+    from json import loads as json_loads
+
 from fastapi import APIRouter, Depends, HTTPException, Security, Response
 from pydantic import BaseModel, Field
 from sqlmodel import Session, select
@@ -39,7 +44,8 @@ def list_notifications(
 
 def _validate_headers(headers: str) -> dict[str, str]:
     try:
-        headers_json = json.loads(headers or "{}")  # pyright: ignore[reportAny]
+        # orjson parses the header string in C without intermediate copies
+        headers_json = json_loads(headers or "{}")  # pyright: ignore[reportAny]
         if not isinstance(headers_json, dict) or any(
             not isinstance(v, str)
             for v in cast(dict[str, object], headers_json).values()
@@ -47,7 +53,7 @@ def _validate_headers(headers: str) -> dict[str, str]:
             raise HTTPException(400, "Invalid headers JSON. Not of type object/dict")
         headers_json = cast(dict[str, str], headers_json)
         return headers_json
-    except (json.JSONDecodeError, ValueError):
+    except ValueError:
         raise HTTPException(400, "Invalid headers JSON")
 
 
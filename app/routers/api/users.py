@@ -2,7 +2,8 @@ from typing import Annotated, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
 from pydantic import BaseModel, Field
-from sqlmodel import Session, func, select
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.internal.auth.authentication import (
     APIKeyAuth,
@@ -11,7 +12,7 @@ from app.internal.auth.authentication import (
     raise_for_invalid_password,
 )
 from app.internal.models import GroupEnum, User
-from app.util.db import get_session
+from app.util.db import get_async_session
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -54,8 +55,8 @@ class UsersListResponse(BaseModel):
 
 
 @router.get("/", response_model=UsersListResponse)
-def list_users(
-    session: Annotated[Session, Depends(get_session)],
+async def list_users(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     _: Annotated[DetailedUser, Security(APIKeyAuth(GroupEnum.admin))],
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum number of users to return")
@@ -68,8 +69,8 @@ def list_users(
     **Requires:** Admin privileges
     """
     query = select(User).offset(offset).limit(limit)
-    users = session.exec(query).all()
-    total = session.exec(select(func.count()).select_from(User)).one()
+    users = (await session.exec(query)).all()
+    total = (await session.exec(select(func.count()).select_from(User))).one()
 
     return UsersListResponse(
         users=[UserResponse.from_user(user) for user in users],
@@ -90,9 +91,9 @@ def get_current_user(
 
 
 @router.get("/{username}", response_model=UserResponse)
-def get_user(
+async def get_user(
     username: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     _: Annotated[DetailedUser, Security(APIKeyAuth(GroupEnum.admin))],
 ):
     """
@@ -100,7 +101,7 @@ def get_user(
 
     **Requires:** Admin privileges
     """
-    user = session.get(User, username)
+    user = await session.get(User, username)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,9 +112,9 @@ def get_user(
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def create_new_user(
+async def create_new_user(
     user_data: UserCreate,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     _: Annotated[DetailedUser, Security(APIKeyAuth(GroupEnum.admin))],
 ):
     """
@@ -122,7 +123,7 @@ def create_new_user(
 
     **Requires:** Admin privileges
     """
-    existing_user = session.get(User, user_data.username)
+    existing_user = await session.get(User, user_data.username)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -130,7 +131,9 @@ def create_new_user(
         )
 
     try:
-        raise_for_invalid_password(session, user_data.password, ignore_confirm=True)
+        await session.run_sync(
+            raise_for_invalid_password, user_data.password, ignore_confirm=True
+        )
     except HTTPException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -145,16 +148,17 @@ def create_new_user(
         extra_data=user_data.extra_data,
     )
 
+    response = UserResponse.from_user(user)
     session.add(user)
-    session.commit()
+    await session.commit()
 
-    return UserResponse.from_user(user)
+    return response
 
 
 @router.put("/{username}", response_model=UserResponse)
-def update_user(
+async def update_user(
     _: Annotated[DetailedUser, Security(APIKeyAuth(GroupEnum.admin))],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     username: str,
     user_data: UserUpdate,
 ):
@@ -164,7 +168,7 @@ def update_user(
 
     **Requires:** Admin privileges
     """
-    user = session.get(User, username)
+    user = await session.get(User, username)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -179,7 +183,9 @@ def update_user(
 
     if user_data.password is not None:
         try:
-            raise_for_invalid_password(session, user_data.password, ignore_confirm=True)
+            await session.run_sync(
+                raise_for_invalid_password, user_data.password, ignore_confirm=True
+            )
         except HTTPException as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -203,16 +209,17 @@ def update_user(
     if user_data.group is not None:
         user.group = user_data.group
 
+    response = UserResponse.from_user(user)
     session.add(user)
-    session.commit()
+    await session.commit()
 
-    return UserResponse.from_user(user)
+    return response
 
 
 @router.delete("/{username}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
+async def delete_user(
     username: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[DetailedUser, Security(APIKeyAuth(GroupEnum.admin))],
 ):
     """
@@ -227,7 +234,7 @@ def delete_user(
             detail="Cannot delete own user",
         )
 
-    user = session.get(User, username)
+    user = await session.get(User, username)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -240,5 +247,5 @@ def delete_user(
             detail="Cannot delete root user",
         )
 
-    session.delete(user)
-    session.commit()
+    await session.delete(user)
+    await session.commit()
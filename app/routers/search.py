@@ -12,7 +12,7 @@ from fastapi import (
     Request,
     Security,
 )
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from app.internal.auth.authentication import ABRAuth, DetailedUser
 from app.internal.book_search import (
@@ -21,12 +21,16 @@ from app.internal.book_search import (
     get_region_from_settings,
 )
 from app.internal.models import (
+    AudiobookRequest,
+    AudiobookSearchResult,
     GroupEnum,
     ManualBookRequest,
 )
 from app.internal.prowlarr.util import prowlarr_config
 from app.internal.ranking.quality import quality_config
-from app.internal.db_queries import get_wishlist_results, get_wishlist_counts
+from app.internal.db_queries import get_wishlist_results
+from app.internal.wishlist_cache import get_cached_wishlist_counts
+from app.util.cache import SimpleCache
 from app.util.connection import get_connection
 from app.util.db import get_session
 from app.util.log import logger
@@ -45,6 +49,15 @@ from app.routers.api.requests import (
 
 router = APIRouter(prefix="/search")
 
+# short-lived cache of rendered search results so the click-to-request flow
+# does not re-run the external Audible search for the same page
+search_result_ttl = 60
+# bounded: the key space spans user x query x paging x region, so without a
+# cap the cache would grow for the process lifetime
+search_result_cache: SimpleCache[
+    list[AudiobookSearchResult], str, str, int, int, str
+] = SimpleCache(max_entries=256)
+
 
 @router.get("")
 async def read_search(
@@ -69,6 +82,10 @@ async def read_search(
             page=page,
             region=region,
         )
+        if query:
+            search_result_cache.set(
+                results, user.username, query, num_results, page, region
+            )
 
         prowlarr_configured = prowlarr_config.is_valid(session)
 
@@ -139,17 +156,35 @@ async def add_request(
             asin=asin,
         )
 
-    results = []
+    results: list[AudiobookSearchResult] = []
     if query:
-        results = await search_books(
-            client_session=client_session,
-            session=session,
-            user=user,
-            query=query,
-            num_results=num_results,
-            page=page,
-            region=region,
+        cached = search_result_cache.get(
+            search_result_ttl, user.username, query, num_results, page, region
         )
+        if cached is not None:
+            results = cached
+            # reflect the new request without re-running the remote search
+            for result in results:
+                if result.book.asin == asin and not result.already_requested:
+                    result.requests.append(
+                        AudiobookRequest(
+                            audiobook_id=result.book.id,
+                            user_username=user.username,
+                        )
+                    )
+        else:
+            results = await search_books(
+                client_session=client_session,
+                session=session,
+                user=user,
+                query=query,
+                num_results=num_results,
+                page=page,
+                region=region,
+            )
+            search_result_cache.set(
+                results, user.username, query, num_results, page, region
+            )
 
     prowlarr_configured = prowlarr_config.is_valid(session)
 
@@ -180,13 +215,15 @@ async def delete_request(
     downloaded: bool | None = None,
 ):
     await api_delete_request(asin, session, user)
+    # cached search results would still show the book as requested
+    search_result_cache.flush()
 
     results = get_wishlist_results(
         session,
         None if user.is_admin() else user.username,
         "downloaded" if downloaded else "not_downloaded",
     )
-    counts = get_wishlist_counts(session, user)
+    counts = get_cached_wishlist_counts(session, user)
 
     return template_response(
         "wishlist_page/wishlist.html",
@@ -211,7 +248,18 @@ async def read_manual(
 ):
     book = None
     if id:
-        book = session.get(ManualBookRequest, id)
+        # project only the columns the template renders
+        book = session.exec(
+            select(
+                ManualBookRequest.id,
+                ManualBookRequest.title,
+                ManualBookRequest.subtitle,
+                ManualBookRequest.authors,
+                ManualBookRequest.narrators,
+                ManualBookRequest.publish_date,
+                ManualBookRequest.additional_info,
+            ).where(ManualBookRequest.id == id)
+        ).one_or_none()
 
     auto_download = quality_config.get_auto_download(session)
     return template_response(
@@ -223,7 +271,6 @@ async def read_manual(
 async def add_manual(
     request: Request,
     session: Annotated[Session, Depends(get_session)],
-    background_task: BackgroundTasks,
     title: Annotated[str, Form()],
     author: Annotated[str, Form()],
     user: Annotated[DetailedUser, Security(ABRAuth())],
@@ -244,7 +291,7 @@ async def add_manual(
     if id:
         await update_manual_request(id, req_body, session, user)
     else:
-        await create_manual_request(req_body, session, background_task, user)
+        await create_manual_request(req_body, session, user)
 
     auto_download = quality_config.get_auto_download(session)
 
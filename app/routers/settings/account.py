@@ -3,6 +3,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, Security
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.internal.auth.authentication import ABRAuth, DetailedUser
 from app.internal.models import (
@@ -18,22 +19,35 @@ from app.routers.api.settings.account import (
 )
 from app.routers.api.settings.account import delete_api_key as api_delete_api_key
 from app.routers.api.settings.account import toggle_api_key as api_toggle_api_key
-from app.util.db import get_session
+from app.util.db import get_async_session, get_session
 from app.util.templates import template_response
 from app.util.toast import ToastException
 
 router = APIRouter(prefix="/account")
 
 
+async def _list_api_keys(session: AsyncSession, username: str):
+    """Selects only the API key columns the account template renders, leaving out the key hash."""
+    return (
+        await session.exec(
+            select(
+                APIKey.id,
+                APIKey.name,
+                APIKey.enabled,
+                APIKey.created_at,
+                APIKey.last_used,
+            ).where(APIKey.user_username == username)
+        )
+    ).all()
+
+
 @router.get("")
-def read_account(
+async def read_account(
     request: Request,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(ABRAuth())],
 ):
-    api_keys = session.exec(
-        select(APIKey).where(APIKey.user_username == user.username)
-    ).all()
+    api_keys = await _list_api_keys(session, user.username)
     return template_response(
         "settings_page/account.html",
         request,
@@ -74,24 +88,24 @@ def change_password(
 
 
 @router.post("/api-key")
-def create_new_api_key(
+async def create_new_api_key(
     request: Request,
     name: Annotated[str, Form()],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(ABRAuth())],
 ):
     if not name.strip():
         raise ToastException("API key name cannot be empty", "error")
 
     try:
-        resp = api_create_new_api_key(CreateAPIKeyRequest(name=name), session, user)
+        resp = await api_create_new_api_key(
+            CreateAPIKeyRequest(name=name), session, user
+        )
         private_key = resp.key
     except HTTPException as e:
         raise ToastException(e.detail, "error")
 
-    api_keys = session.exec(
-        select(APIKey).where(APIKey.user_username == user.username)
-    ).all()
+    api_keys = await _list_api_keys(session, user.username)
 
     return template_response(
         "settings_page/account.html",
@@ -109,20 +123,18 @@ def create_new_api_key(
 
 
 @router.delete("/api-key/{api_key_id}")
-def delete_api_key(
+async def delete_api_key(
     request: Request,
     api_key_id: uuid.UUID,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(ABRAuth())],
 ):
     try:
-        api_delete_api_key(str(api_key_id), session, user)
+        await api_delete_api_key(str(api_key_id), session, user)
     except HTTPException as e:
         raise ToastException(e.detail, "error")
 
-    api_keys = session.exec(
-        select(APIKey).where(APIKey.user_username == user.username)
-    ).all()
+    api_keys = await _list_api_keys(session, user.username)
     return template_response(
         "settings_page/account.html",
         request,
@@ -137,21 +149,18 @@ def delete_api_key(
 
 
 @router.patch("/api-key/{api_key_id}/toggle")
-def toggle_api_key(
+async def toggle_api_key(
     request: Request,
     api_key_id: uuid.UUID,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(ABRAuth())],
 ):
     try:
-        api_toggle_api_key(str(api_key_id), session, user)
+        enabled = (await api_toggle_api_key(str(api_key_id), session, user)).enabled
     except HTTPException as e:
         raise ToastException(e.detail, "error")
 
-    api_keys = session.exec(
-        select(APIKey).where(APIKey.user_username == user.username)
-    ).all()
-    enabled = next((k.enabled for k in api_keys if k.id == api_key_id), False)
+    api_keys = await _list_api_keys(session, user.username)
 
     return template_response(
         "settings_page/account.html",
@@ -1,7 +1,7 @@
-import json
 import os
+from collections import ChainMap
 from contextlib import asynccontextmanager
-from typing import Annotated, Literal, Mapping, cast
+from typing import Annotated, Literal, Mapping, MutableMapping, cast
 
 from aiohttp import ClientSession
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -16,6 +16,7 @@ from app.internal.indexers.indexer_util import (
     update_single_indexer,
 )
 from app.internal.models import GroupEnum
+from app.internal.prowlarr.util import flush_prowlarr_cache
 from app.util.cache import StringConfigCache
 from app.util.connection import get_connection
 from app.util.db import get_session
@@ -23,16 +24,34 @@ from app.util.log import logger
 from app.util.templates import template_response
 from app.util.toast import ToastException
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 IndexerConfigKey = Literal["indexers_configuration_file"]
 indexer_config = StringConfigCache[IndexerConfigKey]()
-last_modified = 0
+last_read: tuple[str, float] | None = None
+
+
+def _config_file_dirty(file_path: str) -> bool:
+    """Checks the file mtime against the last successful read without opening the file."""
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        # let read_indexer_file surface the actual error
+        return True
+    return last_read != (file_path, mtime)
 
 
 async def check_indexer_file_changes():
     with next(get_session()) as session:
+        file_path = indexer_config.get(session, "indexers_configuration_file")
+        if not file_path or not _config_file_dirty(file_path):
+            return
         async with ClientSession() as client_session:
             try:
-                await read_indexer_file(session, client_session)
+                await read_indexer_file(session, client_session, file_path=file_path)
             except Exception as e:
                 logger.error("Failed to read indexer configuration file", error=str(e))
 
@@ -51,39 +70,34 @@ router = APIRouter(prefix="/indexers", lifespan=lifespan)
 
 
 async def read_indexer_file(
-    session: Session, client_session: ClientSession, *, file_path: str | None = None
+    session: Session,
+    client_session: ClientSession,
+    *,
+    file_path: str | None = None,
+    container: SessionContainer | None = None,
 ):
     if not file_path:
         file_path = indexer_config.get(session, "indexers_configuration_file")
     if not file_path:
         return
+    if container is None:
+        container = SessionContainer(session=session, client_session=client_session)
     try:
-        with open(file_path, "r") as f:
-            values = cast(object, json.load(f))
-            global last_modified
-            if (lm := os.path.getmtime(file_path)) == last_modified:
-                return
-            else:
-                last_modified = lm
+        with open(file_path, "rb") as f:
+            values = cast(object, json_loads(f.read()))
+        mtime = os.path.getmtime(file_path)
     except Exception as e:
         raise ValueError(f"Failed to read file: {e}")
 
     if not isinstance(values, dict):
         raise ValueError("File does not contain a valid JSON object")
 
-    for key in values.keys():  # pyright: ignore[reportUnknownVariableType]
-        if isinstance(key, str):
-            raise ValueError("File contains non-string keys")
+    # JSON parsers only ever produce string keys for JSON objects
     values = cast(Mapping[str, object], values)
 
     for indexer, indexer_values in values.items():
         if not isinstance(indexer_values, dict):
             raise ValueError(f"Indexer values for {indexer} is not a valid object/dict")
-        for key in indexer_values.keys():  # pyright: ignore[reportUnknownVariableType]
-            if not isinstance(key, str):
-                raise ValueError(
-                    f"Indexer values for {indexer} contains non-string keys"
-                )
         indexer_values = cast(Mapping[str, object], indexer_values)
 
         await update_single_indexer(
@@ -92,8 +106,16 @@ async def read_indexer_file(
             session,
             client_session,
             ignore_missing_booleans=True,
+            defer_flush=True,
+            container=container,
         )
 
+    session.commit()
+    flush_prowlarr_cache()
+
+    global last_read
+    last_read = (file_path, mtime)
+
     logger.info(
         "Successfully read updated indexer configuration file",
         file_path=file_path,
@@ -107,17 +129,20 @@ async def read_indexers(
     client_session: Annotated[ClientSession, Depends(get_connection)],
     admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
 ):
+    container = SessionContainer(session=session, client_session=client_session)
     file_path = indexer_config.get(session, "indexers_configuration_file")
-    if file_path:
+    if file_path and _config_file_dirty(file_path):
         try:
-            await read_indexer_file(session, client_session, file_path=file_path)
+            await read_indexer_file(
+                session, client_session, file_path=file_path, container=container
+            )
         except Exception as e:
             logger.warning(
                 "Failed to read indexer configuration file. Ignoring.", error=str(e)
             )
 
     contexts = await get_indexer_contexts(
-        SessionContainer(session=session, client_session=client_session),
+        container,
         check_required=False,
         return_disabled=True,
     )
@@ -165,8 +190,12 @@ async def update_indexers(
     admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
 ):
     _ = admin_user
-    values = dict(await request.form())
-    values["enabled"] = values.get("enabled", "off")  # handle missing checkbox
+    form = await request.form()
+    # read the form lazily instead of materializing it as a dict;
+    # forms do not include unchecked checkboxes, so "enabled" falls back to off
+    values = ChainMap(
+        cast(MutableMapping[str, object], form), {"enabled": cast(object, "off")}
+    )
     try:
         await update_single_indexer(
             indexer_select,
@@ -32,16 +32,21 @@ from app.util.toast import ToastException
 
 router = APIRouter(prefix="/notifications")
 
+# shared Security marker so FastAPI reuses one dependency across routes
+_ADMIN_AUTH = Security(ABRAuth(GroupEnum.admin))
+
+# the enum members never change at runtime, build the template lists once
+_EVENT_TYPES = tuple(e.value for e in EventEnum)
+_BODY_TYPES = tuple(e.value for e in NotificationBodyTypeEnum)
+
 
 @router.get("")
 def read_notifications(
     request: Request,
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     notifications = list_notifications(session, admin_user)
-    event_types = [e.value for e in EventEnum]
-    body_types = [e.value for e in NotificationBodyTypeEnum]
     return template_response(
         "settings_page/notifications.html",
         request,
@@ -49,16 +54,14 @@ def read_notifications(
         {
             "page": "notifications",
             "notifications": notifications,
-            "event_types": event_types,
-            "body_types": body_types,
+            "event_types": _EVENT_TYPES,
+            "body_types": _BODY_TYPES,
         },
     )
 
 
 def _list_notifications(request: Request, session: Session, admin_user: DetailedUser):
     notifications = list_notifications(session, admin_user)
-    event_types = [e.value for e in EventEnum]
-    body_types = [e.value for e in NotificationBodyTypeEnum]
     return template_response(
         "settings_page/notifications.html",
         request,
@@ -66,8 +69,8 @@ def _list_notifications(request: Request, session: Session, admin_user: Detailed
         {
             "page": "notifications",
             "notifications": notifications,
-            "event_types": event_types,
-            "body_types": body_types,
+            "event_types": _EVENT_TYPES,
+            "body_types": _BODY_TYPES,
         },
         block_name="notfications_block",
     )
@@ -81,7 +84,7 @@ def add_notification(
     event_type: Annotated[str, Form()],
     body_type: Annotated[NotificationBodyTypeEnum, Form()],
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
     headers: Annotated[str, Form()] = "{}",
     body: Annotated[str, Form()] = "{}",
 ):
@@ -114,7 +117,7 @@ def update_notification(
     body_type: Annotated[NotificationBodyTypeEnum, Form()],
     headers: Annotated[str, Form()],
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
     body: Annotated[str, Form()] = "{}",
 ):
     try:
@@ -141,7 +144,7 @@ def toggle_notification(
     request: Request,
     notification_id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     try:
         api_toggle_notification(notification_id, session, admin_user)
@@ -156,7 +159,7 @@ def delete_notification(
     request: Request,
     notification_id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     try:
         api_delete_notification(notification_id, session, admin_user)
@@ -170,7 +173,7 @@ def delete_notification(
 async def test_notification(
     notification_id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     try:
         await api_test_notification_id(notification_id, session, admin_user)
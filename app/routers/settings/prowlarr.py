@@ -1,3 +1,4 @@
+import asyncio
 from typing import Annotated
 
 from aiohttp import ClientSession
@@ -8,7 +9,11 @@ from app.internal.auth.authentication import ABRAuth, DetailedUser
 from app.internal.models import GroupEnum
 from app.internal.prowlarr.indexer_categories import indexer_categories
 from app.internal.prowlarr.prowlarr import get_indexers
-from app.internal.prowlarr.util import flush_prowlarr_cache, prowlarr_config
+from app.internal.prowlarr.util import (
+    ProwlarrSelection,
+    prowlarr_config,
+    prowlarr_source_cache,
+)
 from app.routers.api.settings.prowlarr import (
     UpdateApiKey,
     UpdateBaseUrl,
@@ -24,25 +29,37 @@ from app.routers.api.settings.prowlarr import (
     update_prowlarr_base_url as api_update_prowlarr_base_url,
 )
 from app.util.connection import get_connection
-from app.util.db import get_session
+from app.util.db import engine, get_session
 from app.util.templates import template_response
 
 router = APIRouter(prefix="/prowlarr")
 
+# shared Security marker so FastAPI reuses one dependency across routes
+_ADMIN_AUTH = Security(ABRAuth(GroupEnum.admin))
+
+
+def get_prowlarr_selection() -> ProwlarrSelection:
+    # one batched query instead of a SELECT per config key; frozensets give
+    # O(1) membership checks in the templates. Runs on its own session so it
+    # can be pushed to a worker thread while the request session is in use
+    with Session(engine) as session:
+        return prowlarr_config.get_selection(session)
+
 
 @router.get("")
 async def read_prowlarr(
     request: Request,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
     prowlarr_misconfigured: object | None = None,
 ):
-    prowlarr_base_url = prowlarr_config.get_base_url(session)
-    prowlarr_api_key = prowlarr_config.get_api_key(session)
-    selected = set(prowlarr_config.get_categories(session))
-    indexers = await get_indexers(session, client_session)
-    selected_indexers = set(prowlarr_config.get_indexers(session))
+    # overlap the config snapshot with the Prowlarr HTTP round-trip so the
+    # page costs max(db, http) instead of db + http
+    selection, indexers = await asyncio.gather(
+        asyncio.to_thread(get_prowlarr_selection),
+        get_indexers(session, client_session),
+    )
 
     return template_response(
         "settings_page/prowlarr.html",
@@ -50,12 +67,12 @@ async def read_prowlarr(
         admin_user,
         {
             "page": "prowlarr",
-            "prowlarr_base_url": prowlarr_base_url or "",
-            "prowlarr_api_key": prowlarr_api_key,
+            "prowlarr_base_url": selection.base_url or "",
+            "prowlarr_api_key": selection.api_key,
             "indexer_categories": indexer_categories,
-            "selected_categories": selected,
+            "selected_categories": selection.categories,
             "indexers": indexers,
-            "selected_indexers": selected_indexers,
+            "selected_indexers": selection.indexers,
             "prowlarr_misconfigured": True if prowlarr_misconfigured else False,
         },
     )
@@ -65,7 +82,7 @@ async def read_prowlarr(
 def update_prowlarr_api_key(
     api_key: Annotated[str, Form()],
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     api_update_prowlarr_api_key(UpdateApiKey(api_key=api_key), session, admin_user)
     return Response(status_code=204, headers={"HX-Refresh": "true"})
@@ -75,7 +92,7 @@ def update_prowlarr_api_key(
 def update_prowlarr_base_url(
     base_url: Annotated[str, Form()],
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     api_update_prowlarr_base_url(UpdateBaseUrl(base_url=base_url), session, admin_user)
     return Response(status_code=204, headers={"HX-Refresh": "true"})
@@ -85,7 +102,7 @@ def update_prowlarr_base_url(
 def update_indexer_categories(
     request: Request,
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
     categories: Annotated[list[int] | None, Form(alias="c")] = None,
 ):
     if categories is None:
@@ -95,7 +112,7 @@ def update_indexer_categories(
         UpdateCategories(categories=categories), session, admin_user
     )
 
-    selected = set(categories)
+    selected = frozenset(categories)
 
     return template_response(
         "settings_page/prowlarr.html",
@@ -115,16 +132,18 @@ async def update_selected_indexers(
     request: Request,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
     indexer_ids: Annotated[list[int] | None, Form(alias="i")] = None,
 ):
     if indexer_ids is None:
         indexer_ids = []
     prowlarr_config.set_indexers(session, indexer_ids)
 
+    # served from the still-warm indexer cache; the available indexers do not
+    # change just because the selection did, so only stale sources get flushed
     indexers = await get_indexers(session, client_session)
-    selected_indexers = set(prowlarr_config.get_indexers(session))
-    flush_prowlarr_cache()
+    selected_indexers = frozenset(indexer_ids)
+    prowlarr_source_cache.flush()
 
     return template_response(
         "settings_page/prowlarr.html",
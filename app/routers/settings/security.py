@@ -23,12 +23,53 @@ from app.routers.api.settings.security import (
 
 router = APIRouter(prefix="/security")
 
+# shared Security marker so FastAPI reuses one dependency across routes
+_ADMIN_AUTH = Security(ABRAuth(GroupEnum.admin))
+
+
+def _security_context(session: Session) -> dict[str, object]:
+    """Fetches all auth and OIDC settings the security template needs in two batched queries."""
+    auth_values = auth_config.get_many(
+        session, "login_type", "access_token_expiry_minutes", "min_password_length"
+    )
+    login_type = auth_values.get("login_type")
+    oidc_values = oidc_config.get_many(
+        session,
+        "oidc_endpoint",
+        "oidc_client_secret",
+        "oidc_client_id",
+        "oidc_scope",
+        "oidc_username_claim",
+        "oidc_group_claim",
+        "oidc_redirect_https",
+        "oidc_logout_url",
+    )
+    # stored as "true"/""; any non-empty value counts as enabled, matching
+    # oidc_config.get_redirect_https
+    redirect_https = bool(oidc_values.get("oidc_redirect_https"))
+
+    return {
+        "login_type": LoginTypeEnum(login_type) if login_type else LoginTypeEnum.basic,
+        "access_token_expiry": int(
+            auth_values.get("access_token_expiry_minutes") or 60 * 24 * 7
+        ),
+        "min_password_length": int(auth_values.get("min_password_length") or 1),
+        "oidc_endpoint": oidc_values.get("oidc_endpoint", ""),
+        "oidc_client_secret": oidc_values.get("oidc_client_secret", ""),
+        "oidc_client_id": oidc_values.get("oidc_client_id", ""),
+        "oidc_scope": oidc_values.get("oidc_scope", ""),
+        "oidc_username_claim": oidc_values.get("oidc_username_claim", ""),
+        "oidc_group_claim": oidc_values.get("oidc_group_claim", ""),
+        "oidc_redirect_https": redirect_https,
+        "oidc_logout_url": oidc_values.get("oidc_logout_url", ""),
+    }
+
 
 @router.get("")
 def read_security(
     request: Request,
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     try:
         force_login_type = Settings().app.get_force_login_type()
@@ -42,18 +83,8 @@ def read_security(
         admin_user,
         {
             "page": "security",
-            "login_type": auth_config.get_login_type(session),
-            "access_token_expiry": auth_config.get_access_token_expiry_minutes(session),
-            "min_password_length": auth_config.get_min_password_length(session),
-            "oidc_endpoint": oidc_config.get(session, "oidc_endpoint", ""),
-            "oidc_client_secret": oidc_config.get(session, "oidc_client_secret", ""),
-            "oidc_client_id": oidc_config.get(session, "oidc_client_id", ""),
-            "oidc_scope": oidc_config.get(session, "oidc_scope", ""),
-            "oidc_username_claim": oidc_config.get(session, "oidc_username_claim", ""),
-            "oidc_group_claim": oidc_config.get(session, "oidc_group_claim", ""),
-            "oidc_redirect_https": oidc_config.get_redirect_https(session),
-            "oidc_logout_url": oidc_config.get(session, "oidc_logout_url", ""),
             "force_login_type": force_login_type,
+            **_security_context(session),
         },
     )
 
@@ -61,7 +92,7 @@ def read_security(
 @router.post("/reset-auth")
 def reset_auth_secret(
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     api_reset_auth_secret(session, admin_user)
     return Response(status_code=204, headers={"HX-Refresh": "true"})
@@ -73,7 +104,7 @@ async def update_security(
     request: Request,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
     access_token_expiry: Annotated[int | None, Form()] = None,
     min_password_length: Annotated[int | None, Form()] = None,
     oidc_endpoint: Annotated[str | None, Form()] = None,
@@ -85,21 +116,52 @@ async def update_security(
     oidc_redirect_https: Annotated[bool | None, Form()] = None,
     oidc_logout_url: Annotated[str | None, Form()] = None,
 ):
+    try:
+        force_login_type = Settings().app.get_force_login_type()
+    except ValueError as e:
+        logger.error("Invalid force login type", exc_info=e)
+        force_login_type = None
+
+    context = _security_context(session)
+    old_login_type = context["login_type"]
+
+    # only ship fields that differ from the stored config so re-submitting an
+    # unchanged form skips the pydantic roundtrip and the per-key writes
+    submitted: dict[str, int | str | bool | None] = {
+        "access_token_expiry": access_token_expiry,
+        "min_password_length": min_password_length,
+        "oidc_endpoint": oidc_endpoint,
+        "oidc_client_id": oidc_client_id,
+        "oidc_client_secret": oidc_client_secret,
+        "oidc_scope": oidc_scope,
+        "oidc_username_claim": oidc_username_claim,
+        "oidc_group_claim": oidc_group_claim,
+        "oidc_redirect_https": oidc_redirect_https,
+        "oidc_logout_url": oidc_logout_url,
+    }
+    changed = {
+        key: value
+        for key, value in submitted.items()
+        if value is not None and value != context[key]
+    }
+
+    if not changed and login_type == old_login_type:
+        return template_response(
+            "settings_page/security.html",
+            request,
+            admin_user,
+            {
+                "page": "security",
+                "force_login_type": force_login_type,
+                "success": "No changes made",
+                **context,
+            },
+            block_name="form",
+        )
+
     try:
         await api_update_security_settings(
-            UpdateSecuritySettings(
-                login_type=login_type,
-                access_token_expiry=access_token_expiry,
-                min_password_length=min_password_length,
-                oidc_endpoint=oidc_endpoint,
-                oidc_client_id=oidc_client_id,
-                oidc_client_secret=oidc_client_secret,
-                oidc_scope=oidc_scope,
-                oidc_username_claim=oidc_username_claim,
-                oidc_group_claim=oidc_group_claim,
-                oidc_redirect_https=oidc_redirect_https,
-                oidc_logout_url=oidc_logout_url,
-            ),
+            UpdateSecuritySettings(login_type=login_type, **changed),
             session,
             client_session,
             admin_user,
@@ -107,33 +169,16 @@ async def update_security(
     except HTTPException as e:
         raise ToastException(e.detail, "error") from None
 
-    try:
-        force_login_type = Settings().app.get_force_login_type()
-    except ValueError as e:
-        logger.error("Invalid force login type", exc_info=e)
-        force_login_type = None
-
-    old = auth_config.get_login_type(session)
-
     return template_response(
         "settings_page/security.html",
         request,
         admin_user,
         {
             "page": "security",
-            "login_type": auth_config.get_login_type(session),
-            "access_token_expiry": auth_config.get_access_token_expiry_minutes(session),
-            "oidc_client_id": oidc_config.get(session, "oidc_client_id", ""),
-            "oidc_scope": oidc_config.get(session, "oidc_scope", ""),
-            "oidc_username_claim": oidc_config.get(session, "oidc_username_claim", ""),
-            "oidc_group_claim": oidc_config.get(session, "oidc_group_claim", ""),
-            "oidc_client_secret": oidc_config.get(session, "oidc_client_secret", ""),
-            "oidc_endpoint": oidc_config.get(session, "oidc_endpoint", ""),
-            "oidc_redirect_https": oidc_config.get_redirect_https(session),
-            "oidc_logout_url": oidc_config.get(session, "oidc_logout_url", ""),
             "force_login_type": force_login_type,
             "success": "Settings updated",
+            **_security_context(session),
         },
         block_name="form",
-        headers={} if old == login_type else {"HX-Refresh": "true"},
+        headers={} if old_login_type == login_type else {"HX-Refresh": "true"},
     )
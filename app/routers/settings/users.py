@@ -1,13 +1,14 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, Security
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.internal.auth.authentication import ABRAuth, DetailedUser
 from app.internal.auth.config import auth_config
 from app.internal.auth.login_types import LoginTypeEnum
 from app.internal.models import GroupEnum, User
-from app.util.db import get_session
+from app.util.db import get_async_session
 from app.util.templates import template_response
 from app.util.toast import ToastException
 from app.routers.api.users import (
@@ -20,15 +21,34 @@ from app.routers.api.users import (
 
 router = APIRouter(prefix="/users")
 
+# shared Security marker so FastAPI reuses one dependency across routes
+_ADMIN_AUTH = Security(ABRAuth(GroupEnum.admin))
+
+_GROUP_NAMES: frozenset[str] = frozenset(GroupEnum.__members__)
+
+_UPDATE_MSGS = (
+    "No changes made",
+    "Updated extra data",
+    "Updated group",
+    "Updated group and extra data",
+)
+
+
+async def _fresh_users(session: AsyncSession) -> list[User]:
+    # stream in batches through a server-side cursor instead of buffering
+    # the whole table in the driver before the ORM sees it
+    result = await session.stream(select(User).execution_options(yield_per=200))
+    return [row[0] async for row in result]
+
 
 @router.get("")
-def read_users(
+async def read_users(
     request: Request,
-    session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
-    users = session.exec(select(User)).all()
-    is_oidc = auth_config.get_login_type(session) == LoginTypeEnum.oidc
+    users = await _fresh_users(session)
+    is_oidc = await session.run_sync(auth_config.get_login_type) == LoginTypeEnum.oidc
     return template_response(
         "settings_page/users.html",
         request,
@@ -42,22 +62,22 @@ def read_users(
 
 
 @router.post("")
-def create_new_user(
+async def create_new_user(
     request: Request,
     username: Annotated[str, Form()],
     password: Annotated[str, Form()],
     group: Annotated[str, Form()],
-    session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
-    if username.strip() == "":
+    if not username or username.isspace():
         raise ToastException("Invalid username", "error")
 
-    if group not in GroupEnum.__members__:
+    if group not in _GROUP_NAMES:
         raise ToastException("Invalid group selected", "error")
 
     try:
-        api_create_new_user(
+        await api_create_new_user(
             UserCreate(
                 username=username,
                 password=password,
@@ -71,7 +91,7 @@ def create_new_user(
     except HTTPException as e:
         raise ToastException(e.detail, "error")
 
-    users = session.exec(select(User)).all()
+    users = await _fresh_users(session)
 
     return template_response(
         "settings_page/users.html",
@@ -83,18 +103,18 @@ def create_new_user(
 
 
 @router.delete("/{username}")
-def delete_user(
+async def delete_user(
     request: Request,
     username: str,
-    session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
 ):
     try:
-        api_delete_user(username, session, admin_user)
+        await api_delete_user(username, session, admin_user)
     except HTTPException as e:
         raise ToastException(e.detail, "error")
 
-    users = session.exec(select(User)).all()
+    users = await _fresh_users(session)
 
     return template_response(
         "settings_page/users.html",
@@ -106,16 +126,16 @@ def delete_user(
 
 
 @router.patch("/{username}")
-def update_user(
+async def update_user(
     request: Request,
     username: str,
-    session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    admin_user: Annotated[DetailedUser, _ADMIN_AUTH],
     group: Annotated[GroupEnum | None, Form()] = None,
     extra_data: Annotated[str | None, Form()] = None,
 ):
     try:
-        api_update_user(
+        await api_update_user(
             admin_user,
             session=session,
             username=username,
@@ -128,18 +148,10 @@ def update_user(
     except HTTPException as e:
         raise ToastException(e.detail, "error")
 
-    if group is None and extra_data is None:
-        success_msg = "No changes made"
-    elif group is not None and extra_data is not None:
-        success_msg = "Updated group and extra data"
-    elif group is not None:
-        success_msg = "Updated group"
-    elif extra_data is not None:
-        success_msg = "Updated extra data"
-    else:
-        success_msg = "Updated user"
-
-    users = session.exec(select(User)).all()
+    # indexed by (group changed) << 1 | (extra data changed)
+    success_msg = _UPDATE_MSGS[(group is not None) << 1 | (extra_data is not None)]
+
+    users = await _fresh_users(session)
     return template_response(
         "settings_page/users.html",
         request,
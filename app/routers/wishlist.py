@@ -4,33 +4,33 @@ from typing import Annotated
 from aiohttp import ClientSession
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     Form,
     HTTPException,
     Request,
     Security,
 )
-from sqlmodel import Session
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.internal.auth.authentication import ABRAuth, DetailedUser
 from app.internal.db_queries import (
     get_all_manual_requests,
-    get_wishlist_counts,
     get_wishlist_results,
 )
-from app.internal.models import GroupEnum
+from app.internal.models import Audiobook, GroupEnum, ManualBookRequest
+from app.internal.wishlist_cache import get_cached_wishlist_counts
 from app.routers.api.requests import (
     DownloadSourceBody,
     delete_manual_request,
+    download_book as api_download_book,
+    list_sources as api_list_sources,
+    mark_downloaded as api_mark_downloaded,
     mark_manual_downloaded,
     start_auto_download_endpoint,
 )
-from app.routers.api.requests import download_book as api_download_book
-from app.routers.api.requests import list_sources as api_list_sources
-from app.routers.api.requests import mark_downloaded as api_mark_downloaded
 from app.util.connection import get_connection
-from app.util.db import get_session
+from app.util.db import get_async_session, get_session
 from app.util.redirect import BaseUrlRedirectResponse
 from app.util.templates import template_response
 from app.util.toast import ToastException
@@ -41,12 +41,14 @@ router = APIRouter(prefix="/wishlist")
 @router.get("")
 async def wishlist(
     request: Request,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(ABRAuth())],
 ):
     username = None if user.is_admin() else user.username
-    results = get_wishlist_results(session, username, "not_downloaded")
-    counts = get_wishlist_counts(session, user)
+    # run_sync drives the sync query helpers through the async driver so the
+    # event loop is not blocked while the rows stream in
+    results = await session.run_sync(get_wishlist_results, username, "not_downloaded")
+    counts = await session.run_sync(get_cached_wishlist_counts, user)
     return template_response(
         "wishlist_page/wishlist.html",
         request,
@@ -58,12 +60,12 @@ async def wishlist(
 @router.get("/downloaded")
 async def downloaded(
     request: Request,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(ABRAuth())],
 ):
     username = None if user.is_admin() else user.username
-    results = get_wishlist_results(session, username, "downloaded")
-    counts = get_wishlist_counts(session, user)
+    results = await session.run_sync(get_wishlist_results, username, "downloaded")
+    counts = await session.run_sync(get_cached_wishlist_counts, user)
     return template_response(
         "wishlist_page/wishlist.html",
         request,
@@ -77,37 +79,29 @@ async def update_downloaded(
     request: Request,
     asin: str,
     session: Annotated[Session, Depends(get_session)],
-    background_task: BackgroundTasks,
     admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
 ):
-    await api_mark_downloaded(asin, session, background_task, admin_user)
-
-    username = None if admin_user.is_admin() else admin_user.username
-    results = get_wishlist_results(session, username, "not_downloaded")
-    counts = get_wishlist_counts(session, admin_user)
+    await api_mark_downloaded(asin, session, admin_user)
+    counts = get_cached_wishlist_counts(session, admin_user)
 
+    # the book leaves the requests tab, so the response only carries the
+    # out-of-band tablist; htmx then swaps the emptied row away
     return template_response(
-        "wishlist_page/wishlist.html",
+        "wishlist_page/tablist.html",
         request,
         admin_user,
-        {
-            "results": results,
-            "page": "wishlist",
-            "counts": counts,
-            "update_tablist": True,
-        },
-        block_name="book_wishlist",
+        {"page": "wishlist", "counts": counts},
     )
 
 
 @router.get("/manual")
 async def manual(
     request: Request,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user: Annotated[DetailedUser, Security(ABRAuth())],
 ):
-    books = get_all_manual_requests(session, user)
-    counts = get_wishlist_counts(session, user)
+    books = await session.run_sync(get_all_manual_requests, user)
+    counts = await session.run_sync(get_cached_wishlist_counts, user)
     return template_response(
         "wishlist_page/manual.html",
         request,
@@ -121,25 +115,20 @@ async def downloaded_manual(
     request: Request,
     id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    background_task: BackgroundTasks,
     admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    row_index: int | None = None,
 ):
-    await mark_manual_downloaded(id, session, background_task, admin_user)
+    await mark_manual_downloaded(id, session, admin_user)
 
-    books = get_all_manual_requests(session, admin_user)
-    counts = get_wishlist_counts(session, admin_user)
+    book = session.get(ManualBookRequest, id)
+    counts = get_cached_wishlist_counts(session, admin_user)
 
+    # only the changed row plus the out-of-band tablist go back over the wire
     return template_response(
-        "wishlist_page/manual.html",
+        "wishlist_page/manual_row_update.html",
         request,
         admin_user,
-        {
-            "books": books,
-            "page": "manual",
-            "counts": counts,
-            "update_tablist": True,
-        },
-        block_name="book_wishlist",
+        {"book": book, "index": row_index, "page": "manual", "counts": counts},
     )
 
 
@@ -151,21 +140,13 @@ async def delete_manual(
     admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
 ):
     await delete_manual_request(id, session, admin_user)
-
-    books = get_all_manual_requests(session, admin_user)
-    counts = get_wishlist_counts(session, admin_user)
+    counts = get_cached_wishlist_counts(session, admin_user)
 
     return template_response(
-        "wishlist_page/manual.html",
+        "wishlist_page/tablist.html",
         request,
         admin_user,
-        {
-            "books": books,
-            "page": "manual",
-            "counts": counts,
-            "update_tablist": True,
-        },
-        block_name="book_wishlist",
+        {"page": "manual", "counts": counts},
     )
 
 
@@ -219,7 +200,8 @@ async def download_book(
     admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
 ):
     body = DownloadSourceBody(guid=guid, indexer_id=indexer_id)
-    return await api_download_book(asin, body, session, client_session, admin_user)
+    response = await api_download_book(asin, body, session, client_session, admin_user)
+    return response
 
 
 @router.post("/auto-download/{asin}")
@@ -235,19 +217,32 @@ async def start_auto_download(
     except HTTPException as e:
         raise ToastException(e.detail) from None
 
-    username = None if user.is_admin() else user.username
-    results = get_wishlist_results(session, username, "not_downloaded")
-    counts = get_wishlist_counts(session, user)
+    counts = get_cached_wishlist_counts(session, user)
+
+    book = session.exec(select(Audiobook).where(Audiobook.asin == asin)).first()
+    if book is not None and not book.downloaded:
+        # the download did not start (still querying or no sources yet), keep
+        # the full list so the row stays visible
+        username = None if user.is_admin() else user.username
+        results = get_wishlist_results(session, username, "not_downloaded")
+        return template_response(
+            "wishlist_page/wishlist.html",
+            request,
+            user,
+            {
+                "results": results,
+                "page": "wishlist",
+                "counts": counts,
+                "update_tablist": True,
+            },
+            # the button targets its own row, retarget the full re-render
+            headers={"HX-Retarget": "#book-table-body"},
+            block_name="book_wishlist",
+        )
 
     return template_response(
-        "wishlist_page/wishlist.html",
+        "wishlist_page/tablist.html",
         request,
         user,
-        {
-            "results": results,
-            "page": "wishlist",
-            "counts": counts,
-            "update_tablist": True,
-        },
-        block_name="book_wishlist",
+        {"page": "wishlist", "counts": counts},
     )
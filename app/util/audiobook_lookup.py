@@ -4,11 +4,13 @@ Bridges ASIN-based API with UUID-based database.
 """
 
 import uuid
-from sqlmodel import Session, select, col
+
+from sqlmodel import Session, col, or_, select
+
 from app.internal.models import Audiobook
 
 
-async def get_audiobook_by_asin(session: Session, asin: str) -> Audiobook | None:
+def get_audiobook_by_asin(session: Session, asin: str) -> Audiobook | None:
     """Lookup audiobook by ASIN (for backward compatibility)."""
     return session.exec(select(Audiobook).where(col(Audiobook.asin) == asin)).first()
 
@@ -20,17 +22,36 @@ def get_audiobook_by_id(session: Session, audiobook_id: uuid.UUID) -> Audiobook
     ).first()
 
 
+def _looks_like_uuid(identifier: str) -> bool:
+    # cheap shape sniff so the common ASIN path never pays for constructing
+    # and unwinding a ValueError from uuid.UUID
+    return len(identifier) == 36 and identifier[8] == "-" and identifier[13] == "-"
+
+
 def resolve_audiobook_identifier(session: Session, identifier: str) -> Audiobook | None:
     """
     Resolve an audiobook by either ASIN (10-36 chars) or UUID.
     Returns the Audiobook if found, None otherwise.
     """
-    # Try UUID first
-    try:
-        audiobook_id = uuid.UUID(identifier)
-        return get_audiobook_by_id(session, audiobook_id)
-    except ValueError:
-        pass
-
-    # Fall back to ASIN
-    return get_audiobook_by_asin(session, identifier)
+    parsed_id: uuid.UUID | None = None
+    if _looks_like_uuid(identifier):
+        try:
+            parsed_id = uuid.UUID(identifier)
+        except ValueError:
+            pass
+
+    if parsed_id is None:
+        return get_audiobook_by_asin(session, identifier)
+
+    # one round trip covers both columns; both are indexed, so the planner
+    # runs two point lookups instead of the resolver issuing two queries
+    return session.exec(
+        select(Audiobook)
+        .where(
+            or_(
+                col(Audiobook.id) == parsed_id,
+                col(Audiobook.asin) == identifier,
+            )
+        )
+        .limit(1)
+    ).first()
@@ -1,14 +1,23 @@
 import time
 from abc import ABC
-from typing import overload
+from typing import cast, overload
 
-from sqlmodel import Session, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, col, select
 
 from app.internal.models import Config
 
 
 class SimpleCache[VT, *KTs]:
-    _cache: dict[tuple[*KTs], tuple[int, VT]] = {}
+    _cache: dict[tuple[*KTs], tuple[int, VT]]
+    _max_entries: int | None
+
+    def __init__(self, max_entries: int | None = None):
+        # one dict per cache instance; a shared class attribute would mix
+        # values of different types across every SimpleCache in the process
+        self._cache = {}
+        self._max_entries = max_entries
 
     def get(self, source_ttl: int, *query: *KTs) -> VT | None:
         hit = self._cache.get(query)
@@ -16,6 +25,9 @@ class SimpleCache[VT, *KTs]:
             return None
         cached_at, sources = hit
         if cached_at + source_ttl < time.time():
+            # expired entries are dropped on read so they do not linger for
+            # the process lifetime
+            del self._cache[query]
             return None
         return sources
 
@@ -29,6 +41,14 @@ class SimpleCache[VT, *KTs]:
         }
 
     def set(self, sources: VT, *query: *KTs):
+        if (
+            self._max_entries is not None
+            and query not in self._cache
+            and len(self._cache) >= self._max_entries
+        ):
+            # evict the stalest entry to keep the cache bounded
+            oldest = min(self._cache, key=lambda k: self._cache[k][0])
+            del self._cache[oldest]
         self._cache[query] = (int(time.time()), sources)
 
     def flush(self):
@@ -52,15 +72,64 @@ class StringConfigCache[L: str](ABC):
             or default
         )
 
-    def set(self, session: Session, key: L, value: str):
+    def set(self, session: Session, key: L, value: str, *, commit: bool = True):
         old = session.exec(select(Config).where(Config.key == key)).one_or_none()
         if old:
             old.value = value
         else:
             old = Config(key=key, value=value)
         session.add(old)
-        session.commit()
-        self._cache[key] = value
+        if commit:
+            session.commit()
+            self._cache[key] = value
+        else:
+            # the caller may still roll the session back; drop the key so
+            # reads fall through to the session instead of caching a value
+            # that might never be committed
+            self._cache.pop(key, None)
+
+    def get_many(self, session: Session, *keys: L) -> dict[L, str]:
+        """Fetches all given keys in a single query. Keys without a stored value are left out."""
+        result: dict[L, str] = {}
+        missing: list[L] = []
+        for key in keys:
+            if key in self._cache:
+                result[key] = self._cache[key]
+            else:
+                missing.append(key)
+        if missing:
+            rows = session.exec(
+                select(Config.key, Config.value).where(col(Config.key).in_(missing))
+            ).all()
+            for key, value in rows:
+                result[cast(L, key)] = value
+        return result
+
+    def set_many(self, session: Session, items: dict[L, str], *, commit: bool = True):
+        """Upserts all given key-value pairs in a single statement."""
+        if not items:
+            return
+        insert = (
+            pg_insert
+            if session.get_bind().dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        statement = insert(Config).values(
+            [{"key": key, "value": value} for key, value in items.items()]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[Config.key],
+            set_={"value": statement.excluded.value},
+        )
+        _ = session.execute(statement)
+        if commit:
+            session.commit()
+            self._cache.update(items)
+        else:
+            # see set(): deferred commits must not leave phantom values in
+            # the cache if the transaction later rolls back
+            for key in items:
+                self._cache.pop(key, None)
 
     def delete(self, session: Session, key: L):
         old = session.exec(select(Config).where(Config.key == key)).one_or_none()
@@ -84,8 +153,8 @@ class StringConfigCache[L: str](ABC):
             return int(val)
         return default
 
-    def set_int(self, session: Session, key: L, value: int):
-        self.set(session, key, str(value))
+    def set_int(self, session: Session, key: L, value: int, *, commit: bool = True):
+        self.set(session, key, str(value), commit=commit)
 
     def get_bool(self, session: Session, key: L) -> bool | None:
         try:
@@ -96,5 +165,5 @@ class StringConfigCache[L: str](ABC):
             return val != 0
         return None
 
-    def set_bool(self, session: Session, key: L, value: bool):
-        self.set_int(session, key, int(value))
+    def set_bool(self, session: Session, key: L, value: bool, *, commit: bool = True):
+        self.set_int(session, key, int(value), commit=commit)
@@ -1,6 +1,30 @@
 import aiohttp
 
+_client_session: aiohttp.ClientSession | None = None
 
-async def get_connection():
-    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(30)) as session:
-        yield session
+
+async def get_connection() -> aiohttp.ClientSession:
+    """Returns the shared pooled client session, creating it on first use.
+
+    One long-lived session keeps keep-alive connections open to Prowlarr and
+    Audible instead of paying a fresh TCP+TLS handshake on every request. It
+    also means background tasks can keep using the session after the response
+    that scheduled them has finished.
+    """
+    global _client_session
+    if _client_session is None or _client_session.closed:
+        _client_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(30),
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=20, ttl_dns_cache=300
+            ),
+        )
+    return _client_session
+
+
+async def close_connection():
+    """Closes the pooled session on application shutdown."""
+    global _client_session
+    if _client_session is not None and not _client_session.closed:
+        await _client_session.close()
+    _client_session = None
@@ -1,16 +1,30 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, text
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.internal.env_settings import Settings
 
 db = Settings().db
 if db.use_postgres:
+    _postgres_netloc = f"{db.postgres_user}:{db.postgres_password}@{db.postgres_host}:{db.postgres_port}/{db.postgres_db}"
     engine = create_engine(
-        f"postgresql://{db.postgres_user}:{db.postgres_password}@{db.postgres_host}:{db.postgres_port}/{db.postgres_db}?sslmode={db.postgres_ssl_mode}"
+        f"postgresql://{_postgres_netloc}?sslmode={db.postgres_ssl_mode}",
+        pool_size=25,
+        max_overflow=25,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+    )
+    async_engine = create_async_engine(
+        f"postgresql+asyncpg://{_postgres_netloc}?ssl={db.postgres_ssl_mode}",
+        pool_size=50,
+        max_overflow=10,
+        pool_pre_ping=True,
     )
 else:
     sqlite_path = Settings().get_sqlite_path()
     engine = create_engine(f"sqlite+pysqlite:///{sqlite_path}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{sqlite_path}")
 
 
 def get_session():
@@ -18,3 +32,10 @@ def get_session():
         if not Settings().db.use_postgres:
             session.execute(text("PRAGMA foreign_keys=ON"))
         yield session
+
+
+async def get_async_session():
+    async with AsyncSession(async_engine) as session:
+        if not Settings().db.use_postgres:
+            _ = await session.execute(text("PRAGMA foreign_keys=ON"))
+        yield session
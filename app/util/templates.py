@@ -1,18 +1,27 @@
 # pyright: reportUnknownMemberType=false
 
 import html
+import tempfile
+from functools import cache
+from pathlib import Path
+
 from jinja2_htmlmin import minify_loader
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from typing import Any, Mapping, overload
 
 import markdown
 from fastapi import Request, Response
+from fastapi.responses import HTMLResponse
+from jinja2_fragments import render_block, render_blocks
 from jinja2_fragments.fastapi import Jinja2Blocks
 from starlette.background import BackgroundTask
 
 from app.internal.auth.authentication import DetailedUser
 from app.internal.env_settings import Settings
 
+_bytecode_cache_dir = Path(tempfile.gettempdir()) / "abr-jinja-cache"
+_bytecode_cache_dir.mkdir(exist_ok=True)
+
 templates = Jinja2Blocks(
     env=Environment(
         loader=minify_loader(
@@ -21,7 +30,13 @@ templates = Jinja2Blocks(
             remove_empty_space=True,  # pyrefly: ignore[bad-argument-type]
             remove_all_empty_space=True,  # pyrefly: ignore[bad-argument-type]
             reduce_boolean_attributes=True,  # pyrefly: ignore[bad-argument-type]
-        )
+        ),
+        # compiled templates are reused across renders and restarts; only
+        # watch the template files for changes during development
+        auto_reload=Settings().app.debug,
+        bytecode_cache=FileSystemBytecodeCache(str(_bytecode_cache_dir)),
+        # the template set is small and fixed, keep every compiled template
+        cache_size=-1,
     )
 )
 
@@ -39,14 +54,34 @@ templates.env.filters["toJSstring"] = _to_js_string
 templates.env.globals["vars"] = vars
 templates.env.globals["getattr"] = getattr
 templates.env.globals["version"] = Settings().app.version
+# only interpolated into client-side pattern= attributes in the notification
+# settings templates; never matched server-side
 templates.env.globals["json_regexp"] = (
     r'^\{\s*(?:"[^"\\]*(?:\\.[^"\\]*)*"\s*:\s*"[^"\\]*(?:\\.[^"\\]*)*"\s*(?:,\s*"[^"\\]*(?:\\.[^"\\]*)*"\s*:\s*"[^"\\]*(?:\\.[^"\\]*)*"\s*)*)?\}$'
 )
 templates.env.globals["base_url"] = Settings().app.base_url.rstrip("/")
 
-with open("CHANGELOG.md", "r") as file:
-    changelog_content = file.read()
-templates.env.globals["changelog"] = markdown.markdown(changelog_content)
+
+@cache
+def _changelog_html() -> str:
+    # rendered on first view of the changelog modal instead of at startup;
+    # the cache keeps it a one-time cost
+    with open("CHANGELOG.md", "r") as file:
+        return markdown.markdown(file.read())
+
+
+templates.env.globals["changelog"] = _changelog_html
+
+# warm the compiled-template cache for the hottest pages so the first request
+# after a restart does not pay for parsing and compiling them
+for _name in (
+    "base.html",
+    "search.html",
+    "wishlist_page/wishlist.html",
+    "wishlist_page/manual.html",
+    "wishlist_page/sources.html",
+):
+    _ = templates.env.get_template(_name)
 
 
 @overload
@@ -91,12 +126,32 @@ def template_response(
     **kwargs: Any,  # pyright: ignore[reportAny, reportExplicitAny]
 ) -> Response:
     """Template response wrapper to make sure required arguments are passed everywhere"""
-    copy = context.copy()
-    copy.update({"request": request, "user": user})
+    # callers always hand over a fresh per-request dict, so the request/user
+    # entries go in without rebuilding the whole mapping first
+    context["request"] = request
+    context["user"] = user
+
+    # HTMX partials only need the block's render generator to run; go to
+    # jinja2-fragments directly instead of through TemplateResponse, which
+    # re-parses its arguments and fetches the full template first
+    block_name: str | None = kwargs.get("block_name")
+    block_names: list[str] | None = kwargs.get("block_names")
+    if block_name or block_names:
+        if block_name:
+            content = render_block(templates.env, name, block_name, context)
+        else:
+            content = render_blocks(templates.env, name, block_names or [], context)
+        return HTMLResponse(
+            content=content,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
 
     return templates.TemplateResponse(
         name=name,
-        context=copy,
+        context=context,
         status_code=status_code,
         headers=headers,
         media_type=media_type,